@@ -1,3 +1,22 @@
-from .attck import Attck
-from .configuration import Configuration, Options
 from .utils.version import __version__
+
+
+def __getattr__(name):
+    """Lazily import the public API (PEP 562).
+
+    Importing pyattck stays cheap; the attck and configuration modules
+    (and their transitive dependencies) load only when first accessed.
+    """
+    if name == "Attck":
+        from .attck import Attck
+
+        return Attck
+    if name in ("Configuration", "Options"):
+        from . import configuration
+
+        return getattr(configuration, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(["Attck", "Configuration", "Options", "__version__"])
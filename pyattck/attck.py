@@ -1,8 +1,12 @@
+import threading
 import warnings
+from importlib import import_module
 
 from .base import Base
 from .configuration import Configuration, Options
 
+_FRAMEWORK_CACHE = {}
+
 
 class Attck(Base):
 
@@ -134,7 +138,12 @@ class Attck(Base):
                         Defaults to https://swimlane-pyattck.s3.us-west-2.amazonaws.com/merged_nist_controls_v1.json.
         generated_nist_json (str, optional): A URL or local file path to the Generated NIST Controls Mapping Json file.
                         Defaults to https://swimlane-pyattck.s3.us-west-2.amazonaws.com/attck_to_nist_controls.json.
+        max_age (int, optional): Cached dataset files younger than this many seconds skip the background
+                        revalidation request entirely. Defaults to 0 (always revalidate).
         interactive (bool, optional): If True, runs the interactive menu within pyattck. Default is False.
+        prefetch (bool or iterable, optional): If True, warms the enterprise, ics, and mobile frameworks on a
+                        background thread. Provide an iterable of framework names to tune which ones.
+                        Defaults to False.
         kwargs (dict, optional): Provided kwargs will be passed to any HTTP requests using the Requests library.
                                  Defaults to None.
 
@@ -142,6 +151,15 @@ class Attck(Base):
         [Attck]: Returns a Attck object that contains all data from MITRE ATT&CK Frameworks
     """
 
+    __slots__ = ("__enterprise", "__preattack", "__mobile", "__ics", "__prefetch_thread")
+
+    _FRAMEWORK_SPEC = {
+        "enterprise": (".enterprise", "EnterpriseAttck", ("enterprise_attck_json", "nist_controls_json")),
+        "preattack": (".preattck", "PreAttck", ("pre_attck_json",)),
+        "mobile": (".mobile", "MobileAttck", ("mobile_attck_json",)),
+        "ics": (".ics", "ICSAttck", ("ics_attck_json", "nist_controls_json")),
+    }
+
     def __init__(
         self,
         nested_techniques=True,
@@ -155,7 +173,9 @@ class Attck(Base):
         ics_attck_json="https://swimlane-pyattck.s3.us-west-2.amazonaws.com/merged_ics_attck_v1.json",
         nist_controls_json="https://swimlane-pyattck.s3.us-west-2.amazonaws.com/merged_nist_controls_v1.json",
         generated_nist_json="https://swimlane-pyattck.s3.us-west-2.amazonaws.com/attck_to_nist_controls.json",
+        max_age=0,
         interactive=False,
+        prefetch=False,
         **kwargs
     ):
         """
@@ -220,7 +240,12 @@ class Attck(Base):
                         Defaults to https://swimlane-pyattck.s3.us-west-2.amazonaws.com/merged_nist_controls_v1.json
             generated_nist_json (str, optional): A URL or local file path to the Generated NIST Controls Mapping Json
                         file. Defaults to https://swimlane-pyattck.s3.us-west-2.amazonaws.com/attck_to_nist_controls.json.
+            max_age (int, optional): Cached dataset files younger than this many seconds skip the background
+                        revalidation request entirely. Defaults to 0 (always revalidate).
             interactive (bool, optional): If True, runs the interactive menu within pyattck. Default is False.
+            prefetch (bool or iterable, optional): If True, warms the enterprise, ics, and mobile frameworks on a
+                        background thread. Provide an iterable of framework names to tune which ones.
+                        Defaults to False.
             kwargs (dict, optional): Provided kwargs will be passed to any HTTP requests using the Requests library.
                                      Defaults to None.
         """
@@ -230,6 +255,7 @@ class Attck(Base):
             save_config=save_config,
             config_file_path=config_file_path,
             kwargs=kwargs,
+            max_age=max_age,
             config=Configuration(
                 data_path=data_path,
                 enterprise_attck_json=enterprise_attck_json,
@@ -240,11 +266,46 @@ class Attck(Base):
                 generated_nist_json=generated_nist_json,
             ),
         )
+        self.__enterprise = None
+        self.__preattack = None
+        self.__mobile = None
+        self.__ics = None
+        self.__prefetch_thread = None
+        if prefetch:
+            names = ("enterprise", "ics", "mobile") if prefetch is True else tuple(prefetch)
+            self.__prefetch_thread = threading.Thread(target=self.__prefetch_frameworks, args=(names,), daemon=True)
+            self.__prefetch_thread.start()
         if interactive:
             from .utils.interactive import Interactive
 
             Interactive(self).generate()
 
+    def __build_framework(self, name):
+        """Builds (or reuses) the framework object for the given name."""
+        if name not in self._FRAMEWORK_SPEC:
+            raise ValueError(f"Unknown framework: {name}")
+        module_name, class_name, config_attrs = self._FRAMEWORK_SPEC[name]
+        sources = tuple(getattr(Base.config.config, attr) for attr in config_attrs)
+        key = (name,) + sources + (Base.config.nested_techniques,)
+        if key not in _FRAMEWORK_CACHE:
+            framework = getattr(import_module(module_name, __package__), class_name)
+            self.__logger.debug(f"Calling MITRE {name} ATT&CK Framework")
+            _FRAMEWORK_CACHE[key] = framework()
+        return _FRAMEWORK_CACHE[key]
+
+    def __prefetch_frameworks(self, names):
+        for name in names:
+            try:
+                self.__build_framework(name)
+            except Exception as e:
+                self.__logger.debug(f"Unable to prefetch the {name} framework: {e}")
+
+    def __join_prefetch(self):
+        thread = self.__prefetch_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+            self.__prefetch_thread = None
+
     @property
     def enterprise(self):
         """Retrieve objects from the Enterprise MITRE ATT&CK Framework.
@@ -252,10 +313,11 @@ class Attck(Base):
         Returns:
             Enterprise: Returns an Enterprise object
         """
-        from .enterprise import EnterpriseAttck
-
-        self.__logger.debug("Calling MITRE Enterprise ATT&CK Framework")
-        return EnterpriseAttck()
+        if self.__enterprise is not None:
+            return self.__enterprise
+        self.__join_prefetch()
+        self.__enterprise = self.__build_framework("enterprise")
+        return self.__enterprise
 
     @property
     def preattack(self):
@@ -264,14 +326,15 @@ class Attck(Base):
         Returns:
             PreAttack: Returns an PreAttack object
         """
-        from .preattck import PreAttck
-
-        self.__logger.debug("Calling MITRE Pre-ATT&CK Framework")
+        if self.__preattack is not None:
+            return self.__preattack
         warnings.warn(
             "MITRE has deprecated the Pre-ATT&CK Framework. "
             "Please use the Enterprise Framework instead and the PreAttack framework will no longer be supported."
         )
-        return PreAttck()
+        self.__join_prefetch()
+        self.__preattack = self.__build_framework("preattack")
+        return self.__preattack
 
     @property
     def mobile(self):
@@ -280,10 +343,11 @@ class Attck(Base):
         Returns:
             PreAttack: Returns an MobileAttack object
         """
-        from .mobile import MobileAttck
-
-        self.__logger.debug("Calling MITRE Mobile ATT&CK Framework")
-        return MobileAttck()
+        if self.__mobile is not None:
+            return self.__mobile
+        self.__join_prefetch()
+        self.__mobile = self.__build_framework("mobile")
+        return self.__mobile
 
     @property
     def ics(self):
@@ -292,11 +356,86 @@ class Attck(Base):
         Returns:
             PreAttack: Returns an ICSAttck object
         """
-        from .ics import ICSAttck
-
-        self.__logger.debug("Calling MITRE ICS ATT&CK Framework")
-        return ICSAttck()
+        if self.__ics is not None:
+            return self.__ics
+        self.__join_prefetch()
+        self.__ics = self.__build_framework("ics")
+        return self.__ics
+
+    def close(self):
+        """Releases cached data and network resources.
+
+        Drops the cached framework objects (including the process-wide
+        shared caches) and closes the underlying HTTP session so the
+        multi-megabyte parsed graphs become garbage collectable. The
+        object remains usable afterwards; the next property access
+        rebuilds from the cached files on disk.
+        """
+        self.__join_prefetch()
+        self.__enterprise = None
+        self.__preattack = None
+        self.__mobile = None
+        self.__ics = None
+        _FRAMEWORK_CACHE.clear()
+        if Base.config is not None:
+            Base.config._clear_json_cache()
+            Base.config._close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def update(self, enterprise=False, preattack=False, mobile=False, ics=False, nist=False, generated=False) -> bool:
+        """Updates the local cached JSON files.
+
+        Each flag refreshes a single dataset, so the network cost
+        matches what you actually need; the NIST controls and generated
+        mapping files have their own release cadence and no longer have
+        to ride along with an enterprise refresh. Calling update() with
+        no flags refreshes every dataset, matching the old behavior.
 
-    def update(self) -> bool:
-        """Updates the local cached JSON files."""
-        return True if Base.config._save_json_data(force=True) else False
+        Args:
+            enterprise (bool, optional): Refresh the Enterprise ATT&CK JSON. Defaults to False.
+            preattack (bool, optional): Refresh the PRE-ATT&CK JSON. Defaults to False.
+            mobile (bool, optional): Refresh the Mobile ATT&CK JSON. Defaults to False.
+            ics (bool, optional): Refresh the ICS ATT&CK JSON. Defaults to False.
+            nist (bool, optional): Refresh the NIST Controls JSON. Defaults to False.
+            generated (bool, optional): Refresh the Generated NIST Controls Mapping JSON. Defaults to False.
+        """
+        flags = {
+            "enterprise_attck_json": enterprise,
+            "pre_attck_json": preattack,
+            "mobile_attck_json": mobile,
+            "ics_attck_json": ics,
+            "nist_controls_json": nist,
+            "generated_nist_json": generated,
+        }
+        only = [key for key, wanted in flags.items() if wanted] or None
+        if only is None:
+            stale = {"enterprise", "preattack", "mobile", "ics"}
+        else:
+            stale = set()
+            if enterprise:
+                stale.add("enterprise")
+            if preattack:
+                stale.add("preattack")
+            if mobile:
+                stale.add("mobile")
+            if ics:
+                stale.add("ics")
+            if nist:
+                stale.update(("enterprise", "ics"))
+        if "enterprise" in stale:
+            self.__enterprise = None
+        if "preattack" in stale:
+            self.__preattack = None
+        if "mobile" in stale:
+            self.__mobile = None
+        if "ics" in stale:
+            self.__ics = None
+        for key in list(_FRAMEWORK_CACHE):
+            if key[0] in stale:
+                del _FRAMEWORK_CACHE[key]
+        return True if Base.config._save_json_data(force=True, only=only) else False
@@ -1,11 +1,19 @@
 # Copyright: (c) 2022, Swimlane <info@swimlane.com>
 # MIT License (see LICENSE or https://opensource.org/licenses/MIT)
+import os
+import pickle
+import tempfile
+
 from .utils.logger import LoggingBase
+from .utils.utils import is_url
 
 
 class Base(metaclass=LoggingBase):
 
+    __slots__ = ()
+
     config = None
+    PKL_VERSION = 1
     LOGO = "CgouX19fX19fICAgX19fXyAgICBfX19fICBfX18gICAuX19fX19fX19fX18uX19fX19fX19fX18uICBfX19fX18gIF9fICBfX18KfCAgIF8gIFwgIFwgICBcICAvICAgLyAvICAgXCAgfCAgICAgICAgICAgfCAgICAgICAgICAgfCAvICAgICAgfHwgIHwvICAvCnwgIHxfKSAgfCAgXCAgIFwvICAgLyAvICBeICBcIGAtLS18ICB8LS0tLWAtLS18ICB8LS0tLWB8ICAsLS0tLSd8ICAnICAvCnwgICBfX18vICAgIFxfICAgIF8vIC8gIC9fXCAgXCAgICB8ICB8ICAgICAgICB8ICB8ICAgICB8ICB8ICAgICB8ICAgIDwKfCAgfCAgICAgICAgICB8ICB8ICAvICBfX19fXyAgXCAgIHwgIHwgICAgICAgIHwgIHwgICAgIHwgIGAtLS0tLnwgIC4gIFwKfCBffCAgICAgICAgICB8X198IC9fXy8gICAgIFxfX1wgIHxfX3wgICAgICAgIHxfX3wgICAgICBcX19fX19ffHxfX3xcX19cCgo="
     FRAMEWORKS = ["enterprise", "ics", "mobile", "preattack"]
     ATTCK_TYPES = [
@@ -20,3 +28,57 @@ class Base(metaclass=LoggingBase):
         "techniques",
         "tools",
     ]
+
+    def _get_attck_data(self, value, model):
+        """Builds a dataset model, reusing a pickled sidecar when fresh.
+
+        After the first successful build the constructed model is pickled
+        into data_path keyed by the source file's mtime and size. Later
+        startups load the pickle directly and skip JSON parsing and model
+        validation entirely, as long as the source file is unchanged.
+        PKL_VERSION invalidates existing sidecars on schema changes.
+
+        Args:
+            value (str): A key value in our configuration file.
+            model: The pyattck-data model class to build.
+
+        Returns:
+            The constructed model object.
+        """
+        source = getattr(Base.config.config, value)
+        json_path = os.path.join(Base.config.config.data_path, f"{value}.json") if is_url(source) else source
+        pkl_path = os.path.join(Base.config.config.data_path, f"{value}.pkl")
+        stat = os.stat(json_path) if os.path.exists(json_path) else None
+        if stat:
+            try:
+                with open(pkl_path, "rb") as f:
+                    sidecar = pickle.load(f)
+                if (
+                    sidecar.get("version") == self.PKL_VERSION
+                    and sidecar.get("mtime_ns") == stat.st_mtime_ns
+                    and sidecar.get("size") == stat.st_size
+                ):
+                    Base.config._schedule_revalidation(value)
+                    return sidecar["data"]
+            except Exception as e:
+                pass
+        data = model(**Base.config.get_data(value))
+        if stat is None and os.path.exists(json_path):
+            stat = os.stat(json_path)
+        if stat:
+            try:
+                with tempfile.NamedTemporaryFile(mode="wb", dir=os.path.dirname(pkl_path), delete=False) as f:
+                    pickle.dump(
+                        {
+                            "version": self.PKL_VERSION,
+                            "mtime_ns": stat.st_mtime_ns,
+                            "size": stat.st_size,
+                            "data": data,
+                        },
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                os.replace(f.name, pkl_path)
+            except Exception as e:
+                pass
+        return data
@@ -1,15 +1,29 @@
 import json
+import mmap
 import os
+import tempfile
+import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import requests
 import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from attrs import asdict, define, field
 from pydantic import DirectoryPath, FilePath, HttpUrl
-from requests.api import request
+from requests.adapters import HTTPAdapter
 
 from .utils.exceptions import UnknownFileError
 from .utils.utils import get_absolute_path, is_path, is_url
 
+_CACHE_META_LOCK = threading.Lock()
+_JSON_CACHE = {}
+
 
 @define
 class Configuration:
@@ -62,23 +76,54 @@ class Options:
     config_file_path: FilePath = field(default="~/pyattck/config.yml", converter=get_absolute_path)
     config: Configuration = field(factory=Configuration)
     kwargs: dict = field(factory=dict)
+    max_age: int = field(default=0)
+    _session: requests.Session = field(init=False, default=None, repr=False, eq=False)
+
+    def _get_session(self):
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=6)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            object.__setattr__(self, "_session", session)
+        return self._session
+
+    def _clear_json_cache(self):
+        _JSON_CACHE.clear()
+
+    def _close(self):
+        if self._session is not None:
+            self._session.close()
+            object.__setattr__(self, "_session", None)
 
     def _download_url_data(self, url):
-        response = request("GET", url, **self.kwargs)
+        response = self._get_session().get(url, **self.kwargs)
         if response.status_code == 200:
+            if orjson:
+                return orjson.loads(response.content)
             return response.json()
         return {}
 
     def _read_from_disk(self, path):
         if os.path.exists(path) and os.path.isfile(path):
             try:
-                with open(path) as f:
-                    if path.endswith(".json"):
+                if path.endswith(".json"):
+                    with open(path, "rb") as f:
+                        if orjson:
+                            try:
+                                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                            except (ValueError, OSError):
+                                return orjson.loads(f.read())
+                            try:
+                                return orjson.loads(memoryview(buffer))
+                            finally:
+                                buffer.close()
                         return json.load(f)
-                    elif path.endswith(".yml") or path.endswith(".yaml"):
+                elif path.endswith(".yml") or path.endswith(".yaml"):
+                    with open(path) as f:
                         return Configuration(**yaml.load(f, Loader=yaml.SafeLoader))
-                    else:
-                        raise UnknownFileError(provided_value=path, known_values=[".json", ".yml", ".yaml"])
+                else:
+                    raise UnknownFileError(provided_value=path, known_values=[".json", ".yml", ".yaml"])
             except Exception as e:
                 warnings.warn(
                     message=f"The provided config file {path} is not in the correct format. "
@@ -107,12 +152,16 @@ class Options:
         except IsADirectoryError as ie:
             raise Exception(f"The provided path is a directory: {path}")
 
-    def _save_json_data(self, force: bool = False) -> None:
+    def _ensure_data_path(self):
         if not os.path.exists(self.config.data_path):
             try:
                 os.makedirs(self.config.data_path)
             except Exception as e:
                 raise Exception("Unable to save data to the provided location: {}".format(self.config.data_path))
+
+    def _save_json_data(self, force: bool = False, only=None) -> None:
+        self._ensure_data_path()
+        missing = []
         for json_data in [
             "enterprise_attck_json",
             "pre_attck_json",
@@ -121,27 +170,135 @@ class Options:
             "nist_controls_json",
             "generated_nist_json",
         ]:
+            if only is not None and json_data not in only:
+                continue
             if is_url(getattr(self.config, json_data)):
-                try:
-                    path = os.path.join(self.config.data_path, f"{json_data}.json")
-                    if not os.path.exists(path) or force:
-                        data = self._download_url_data(getattr(self.config, json_data))
-                        self._save_to_disk(path, data)
-                except Exception as e:
-                    raise Warning(f"Unable to download data from {json_data}")
+                path = os.path.join(self.config.data_path, f"{json_data}.json")
+                if not os.path.exists(path) or force:
+                    missing.append((json_data, path))
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                futures = {
+                    executor.submit(self._download_and_save, json_data, path): json_data
+                    for json_data, path in missing
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        raise Warning(f"Unable to download data from {futures[future]}")
         return True
 
+    def _download_and_save(self, json_data, path):
+        self._stream_to_disk(getattr(self.config, json_data), path)
+
+    def _stream_to_disk(self, url, path, headers=None):
+        kwargs = dict(self.kwargs)
+        kwargs.setdefault("timeout", 30)
+        if headers:
+            merged = dict(kwargs.get("headers") or {})
+            merged.update(headers)
+            kwargs["headers"] = merged
+        response = self._get_session().get(url, stream=True, **kwargs)
+        if response.status_code == 200:
+            f = tempfile.NamedTemporaryFile(mode="wb", dir=os.path.dirname(path), delete=False)
+            try:
+                with f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+            except Exception as e:
+                os.unlink(f.name)
+                raise
+            os.replace(f.name, path)
+            self._update_cache_meta(url, response.headers)
+            _JSON_CACHE.pop(url, None)
+        return response
+
+    def _cache_meta_path(self):
+        return os.path.join(self.config.data_path, ".pyattck_cache.json")
+
+    def _read_cache_meta(self):
+        meta = self._read_from_disk(self._cache_meta_path())
+        return meta if isinstance(meta, dict) else {}
+
+    def _update_cache_meta(self, url, headers):
+        with _CACHE_META_LOCK:
+            meta = self._read_cache_meta()
+            meta[url] = {
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+            }
+            self._save_to_disk(self._cache_meta_path(), meta)
+
+    def _schedule_revalidation(self, value):
+        """Starts a background conditional GET for a cached dataset file.
+
+        Does nothing for local-file sources, missing cache files, or
+        caches younger than max_age seconds.
+        """
+        data = getattr(self.config, value)
+        if not is_url(data):
+            return
+        path = os.path.join(self.config.data_path, f"{value}.json")
+        if not os.path.exists(path):
+            return
+        if self.max_age <= 0 or time.time() - os.path.getmtime(path) >= self.max_age:
+            threading.Thread(target=self._revalidate, args=(data, path), daemon=True).start()
+
+    def _revalidate(self, url, path):
+        try:
+            meta = self._read_cache_meta().get(url, {})
+            headers = {}
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+            self._stream_to_disk(url, path, headers=headers)
+        except Exception as e:
+            pass
+
     def get_data(self, value: str) -> dict:
         """Retrieves saved data based on key value in config.
 
+        When the configured value is a URL, any previously downloaded
+        copy in data_path is served immediately and refreshed in the
+        background with a conditional GET (stale-while-revalidate).
+        Caches younger than max_age seconds skip the revalidation.
+
+        Parsed data is shared process-wide keyed by the configured
+        source, so repeated calls (and multiple Attck instances using
+        the same configuration) reuse a single parsed dictionary. The
+        data is treated as read-only in-process.
+
         Args:
             value (str): A key value in our configuration file.
 
         Returns:
             dict: The dictionary object which was retrieved.
         """
+        data = getattr(self.config, value)
+        key = data if is_url(data) else os.path.realpath(data)
+        if key in _JSON_CACHE:
+            return _JSON_CACHE[key]
+        result = self._load_data(value)
+        if result:
+            _JSON_CACHE[key] = result
+        return result
+
+    def _load_data(self, value):
         data = getattr(self.config, value)
         if is_url(data):
+            path = os.path.join(self.config.data_path, f"{value}.json")
+            if os.path.exists(path):
+                self._schedule_revalidation(value)
+                return self._read_from_disk(path)
+            try:
+                self._ensure_data_path()
+                self._stream_to_disk(data, path)
+            except Exception as e:
+                pass
+            if os.path.exists(path):
+                return self._read_from_disk(path)
             return self._download_url_data(data)
         else:
             return self._read_from_disk(getattr(self.config, value))
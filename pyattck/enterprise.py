@@ -30,19 +30,21 @@ class EnterpriseAttck(Base):
     These can be found [here](https://github.com/swimlane/pyattck-data)
     """
 
-    __tactics = []
-    __techniques = []
-    __mitigations = []
-    __relationships = []
-    __actors = []
-    __campaigns = []
-    __tools = []
-    __malwares = []
-    __controls = []
-    __data_sources = []
-    __data_components = []
-    __nist_controls_json = NistControls(**Base.config.get_data("nist_controls_json"))
-    __attck = MitreAttck(**Base.config.get_data("enterprise_attck_json"))
+    def __init__(self):
+        """Builds the Enterprise framework data from the configured data sources."""
+        self.__tactics = None
+        self.__techniques = None
+        self.__mitigations = None
+        self.__relationships = None
+        self.__actors = None
+        self.__campaigns = None
+        self.__tools = None
+        self.__malwares = None
+        self.__controls = None
+        self.__data_sources = None
+        self.__data_components = None
+        self.__nist_controls_json = self._get_attck_data("nist_controls_json", NistControls)
+        self.__attck = self._get_attck_data("enterprise_attck_json", MitreAttck)
 
     @property
     def actors(self):
@@ -51,7 +53,7 @@ class EnterpriseAttck(Base):
         Returns:
             (Actor) -- (Returns a list of Actor objects)
         """
-        if not self.__actors:
+        if self.__actors is None:
             self.__actors = [x for x in self.__attck.objects if x.type == "intrusion-set"]
         return self.__actors
 
@@ -62,7 +64,7 @@ class EnterpriseAttck(Base):
         Returns:
             (Campaign) -- (Returns a list of Campaign objects)
         """
-        if not self.__campaigns:
+        if self.__campaigns is None:
             self.__campaigns = [x for x in self.__attck.objects if x.type == "campaign"]
         return self.__campaigns
 
@@ -73,7 +75,8 @@ class EnterpriseAttck(Base):
         Returns:
             (Control) -- Returns a list of Control objects
         """
-        if not self.__controls:
+        if self.__controls is None:
+            self.__controls = []
             if self.__nist_controls_json.objects:
                 self.__controls = [x for x in self.__nist_controls_json.objects if x.type == "course-of-action"]
         return self.__controls
@@ -85,7 +88,7 @@ class EnterpriseAttck(Base):
         Returns:
             (DataComponent) -- Returns a list of DataComponent objects
         """
-        if not self.__data_components:
+        if self.__data_components is None:
             self.__data_components = [x for x in self.__attck.objects if x.type == "x-mitre-data-component"]
         return self.__data_components
 
@@ -96,7 +99,7 @@ class EnterpriseAttck(Base):
         Returns:
             (DataSource) -- Returns a list of DataSource objects
         """
-        if not self.__data_sources:
+        if self.__data_sources is None:
             self.__data_sources = [x for x in self.__attck.objects if x.type == "x-mitre-data-source"]
         return self.__data_sources
 
@@ -107,7 +110,7 @@ class EnterpriseAttck(Base):
         Returns:
             (Malware) -- Returns a list of Malware objects
         """
-        if not self.__malwares:
+        if self.__malwares is None:
             self.__malwares = [x for x in self.__attck.objects if x.type == "malware"]
         return self.__malwares
 
@@ -118,7 +121,7 @@ class EnterpriseAttck(Base):
         Returns:
             (Mitigation) -- (Returns a list of Mitigation objects)
         """
-        if not self.__mitigations:
+        if self.__mitigations is None:
             self.__mitigations = [x for x in self.__attck.objects if x.type == "course-of-action"]
         return self.__mitigations
     
@@ -129,7 +132,7 @@ class EnterpriseAttck(Base):
         Returns:
             (Relationship) -- (Returns a list of Relationship objects)
         """
-        if not self.__relationships:
+        if self.__relationships is None:
             self.__relationships = [x for x in self.__attck.objects if x.type == "relationship" and hasattr(x, 'relationship_type') and x.relationship_type == 'uses']
         return self.__relationships
 
@@ -140,7 +143,7 @@ class EnterpriseAttck(Base):
         Returns:
             (Tactic) -- (Returns a list of Tactic objects)
         """
-        if not self.__tactics:
+        if self.__tactics is None:
             self.__tactics = [x for x in self.__attck.objects if x.type == "x-mitre-tactic"]
         return self.__tactics
 
@@ -151,7 +154,8 @@ class EnterpriseAttck(Base):
         Returns:
             (Technique) -- Returns a list of Technique objects
         """
-        if not self.__techniques:
+        if self.__techniques is None:
+            self.__techniques = []
             for item in self.__attck.objects:
                 if item.type == "attack-pattern":
                     if item.techniques and not Base.config.nested_techniques:
@@ -167,6 +171,6 @@ class EnterpriseAttck(Base):
         Returns:
             (Tool) -- Returns a list of Tool objects
         """
-        if not self.__tools:
+        if self.__tools is None:
             self.__tools = [x for x in self.__attck.objects if x.type == "tool"]
         return self.__tools
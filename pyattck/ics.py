@@ -31,15 +31,17 @@ class ICSAttck(Base):
 
     """
 
-    __tactics = []
-    __techniques = []
-    __mitigations = []
-    __malwares = []
-    __controls = []
-    __data_sources = []
-    __data_components = []
-    __nist_controls_json = NistControls(**Base.config.get_data("nist_controls_json"))
-    __attck = MitreAttck(**Base.config.get_data("ics_attck_json"))
+    def __init__(self):
+        """Builds the ICS framework data from the configured data sources."""
+        self.__tactics = None
+        self.__techniques = None
+        self.__mitigations = None
+        self.__malwares = None
+        self.__controls = None
+        self.__data_sources = None
+        self.__data_components = None
+        self.__nist_controls_json = self._get_attck_data("nist_controls_json", NistControls)
+        self.__attck = self._get_attck_data("ics_attck_json", MitreAttck)
 
     @property
     def controls(self):
@@ -48,7 +50,8 @@ class ICSAttck(Base):
         Returns:
             (Control) -- Returns a list of Control objects
         """
-        if not self.__controls:
+        if self.__controls is None:
+            self.__controls = []
             if self.__nist_controls_json.objects:
                 self.__controls = [x for x in self.__nist_controls_json.objects if x.type == "course-of-action"]
         return self.__controls
@@ -60,7 +63,7 @@ class ICSAttck(Base):
         Returns:
             (DataComponent) -- Returns a list of DataComponent objects
         """
-        if not self.__data_components:
+        if self.__data_components is None:
             self.__data_components = [x for x in self.__attck.objects if x.type == "x-mitre-data-component"]
         return self.__data_components
 
@@ -71,7 +74,7 @@ class ICSAttck(Base):
         Returns:
             (DataSource) -- Returns a list of DataSource objects
         """
-        if not self.__data_sources:
+        if self.__data_sources is None:
             self.__data_sources = [x for x in self.__attck.objects if x.type == "x-mitre-data-source"]
         return self.__data_sources
 
@@ -82,7 +85,7 @@ class ICSAttck(Base):
         Returns:
             (Malware) -- Returns a list of Malware objects
         """
-        if not self.__malwares:
+        if self.__malwares is None:
             self.__malwares = [x for x in self.__attck.objects if x.type == "malware"]
         return self.__malwares
 
@@ -93,7 +96,7 @@ class ICSAttck(Base):
         Returns:
             (Mitigation) -- (Returns a list of Mitigation objects)
         """
-        if not self.__mitigations:
+        if self.__mitigations is None:
             self.__mitigations = [x for x in self.__attck.objects if x.type == "course-of-action"]
         return self.__mitigations
 
@@ -104,7 +107,7 @@ class ICSAttck(Base):
         Returns:
             (Tactic) -- (Returns a list of Tactic objects)
         """
-        if not self.__tactics:
+        if self.__tactics is None:
             self.__tactics = [x for x in self.__attck.objects if x.type == "x-mitre-tactic"]
         return self.__tactics
 
@@ -115,7 +118,8 @@ class ICSAttck(Base):
         Returns:
             (Technique) -- Returns a list of Technique objects
         """
-        if not self.__techniques:
+        if self.__techniques is None:
+            self.__techniques = []
             for item in self.__attck.objects:
                 if item.type == "attack-pattern":
                     if item.techniques and not Base.config.nested_techniques:
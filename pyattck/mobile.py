@@ -25,13 +25,15 @@ class MobileAttck(Base):
     These can be found [here](https://github.com/swimlane/pyattck-data)
     """
 
-    __tactics = []
-    __techniques = []
-    __mitigations = []
-    __actors = []
-    __tools = []
-    __malwares = []
-    __attck = MitreAttck(**Base.config.get_data("mobile_attck_json"))
+    def __init__(self):
+        """Builds the Mobile framework data from the configured data sources."""
+        self.__tactics = None
+        self.__techniques = None
+        self.__mitigations = None
+        self.__actors = None
+        self.__tools = None
+        self.__malwares = None
+        self.__attck = self._get_attck_data("mobile_attck_json", MitreAttck)
 
     @property
     def actors(self):
@@ -40,7 +42,7 @@ class MobileAttck(Base):
         Returns:
             (Actor) -- (Returns a list of Actor objects)
         """
-        if not self.__actors:
+        if self.__actors is None:
             self.__actors = [x for x in self.__attck.objects if x.type == "intrusion-set"]
         return self.__actors
 
@@ -51,7 +53,7 @@ class MobileAttck(Base):
         Returns:
             (Malware) -- Returns a list of Malware objects
         """
-        if not self.__malwares:
+        if self.__malwares is None:
             self.__malwares = [x for x in self.__attck.objects if x.type == "malware"]
         return self.__malwares
 
@@ -62,7 +64,7 @@ class MobileAttck(Base):
         Returns:
             (Mitigation) -- (Returns a list of Mitigation objects)
         """
-        if not self.__mitigations:
+        if self.__mitigations is None:
             self.__mitigations = [x for x in self.__attck.objects if x.type == "course-of-action"]
         return self.__mitigations
 
@@ -73,7 +75,7 @@ class MobileAttck(Base):
         Returns:
             (Tactic) -- (Returns a list of Tactic objects)
         """
-        if not self.__tactics:
+        if self.__tactics is None:
             self.__tactics = [x for x in self.__attck.objects if x.type == "x-mitre-tactic"]
         return self.__tactics
 
@@ -84,7 +86,8 @@ class MobileAttck(Base):
         Returns:
             (Technique) -- Returns a list of Technique objects
         """
-        if not self.__techniques:
+        if self.__techniques is None:
+            self.__techniques = []
             for item in self.__attck.objects:
                 if item.type == "attack-pattern":
                     if item.techniques and not Base.config.nested_techniques:
@@ -100,6 +103,6 @@ class MobileAttck(Base):
         Returns:
             (Tool) -- Returns a list of Tool objects
         """
-        if not self.__tools:
+        if self.__tools is None:
             self.__tools = [x for x in self.__attck.objects if x.type == "tool"]
         return self.__tools
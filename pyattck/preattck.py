@@ -22,10 +22,12 @@ class PreAttck(Base):
     These can be found [here](https://github.com/swimlane/pyattck-data)
     """
 
-    __tactics = []
-    __techniques = []
-    __actors = []
-    __attck = MitreAttck(**Base.config.get_data("pre_attck_json"))
+    def __init__(self):
+        """Builds the PRE-ATT&CK framework data from the configured data sources."""
+        self.__tactics = None
+        self.__techniques = None
+        self.__actors = None
+        self.__attck = self._get_attck_data("pre_attck_json", MitreAttck)
 
     @property
     def actors(self):
@@ -34,7 +36,7 @@ class PreAttck(Base):
         Returns:
             (Actor) -- (Returns a list of Actor objects)
         """
-        if not self.__actors:
+        if self.__actors is None:
             self.__actors = [x for x in self.__attck.objects if x.type == "intrusion-set"]
         return self.__actors
 
@@ -45,7 +47,7 @@ class PreAttck(Base):
         Returns:
             (Tactic) -- (Returns a list of Tactic objects)
         """
-        if not self.__tactics:
+        if self.__tactics is None:
             self.__tactics = [x for x in self.__attck.objects if x.type == "x-mitre-tactic"]
         return self.__tactics
 
@@ -56,7 +58,8 @@ class PreAttck(Base):
         Returns:
             (Technique) -- Returns a list of Technique objects
         """
-        if not self.__techniques:
+        if self.__techniques is None:
+            self.__techniques = []
             for item in self.__attck.objects:
                 if item.type == "attack-pattern":
                     if item.techniques and not Base.config.nested_techniques:
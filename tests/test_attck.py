@@ -78,3 +78,68 @@ def test_passed_kwargs():
     }
     attck = Attck(**args)
     assert attck.config.kwargs == args
+
+
+def test_attck_context_manager_closes():
+    from pyattck import Attck
+    from pyattck.attck import _FRAMEWORK_CACHE
+
+    with Attck() as attck:
+        attck._Attck__enterprise = object()
+        _FRAMEWORK_CACHE[("enterprise", "source", "controls", True)] = object()
+    assert attck._Attck__enterprise is None
+    assert _FRAMEWORK_CACHE == {}
+    attck.close()
+
+
+def test_attck_prefetch_builds_selected_frameworks(monkeypatch):
+    from pyattck import Attck
+
+    built = []
+    monkeypatch.setattr(Attck, "_Attck__build_framework", lambda self, name: built.append(name))
+
+    attck = Attck(prefetch=("mobile",))
+    attck._Attck__join_prefetch()
+    assert built == ["mobile"]
+
+    built.clear()
+    attck = Attck(prefetch=True)
+    attck._Attck__join_prefetch()
+    assert built == ["enterprise", "ics", "mobile"]
+
+
+def test_attck_update_refreshes_selected_datasets(monkeypatch):
+    from pyattck import Attck
+    from pyattck.configuration import Options
+
+    calls = {}
+
+    def fake_save_json_data(self, force=False, only=None):
+        calls["force"] = force
+        calls["only"] = only
+        return True
+
+    monkeypatch.setattr(Options, "_save_json_data", fake_save_json_data)
+    attck = Attck()
+    assert attck.update(mobile=True)
+    assert calls["force"] is True
+    assert calls["only"] == ["mobile_attck_json"]
+    assert attck.update()
+    assert calls["only"] is None
+
+
+def test_attck_update_nist_invalidates_dependent_frameworks(monkeypatch):
+    from pyattck import Attck
+    from pyattck.attck import _FRAMEWORK_CACHE
+    from pyattck.configuration import Options
+
+    monkeypatch.setattr(Options, "_save_json_data", lambda self, force=False, only=None: True)
+    attck = Attck()
+    _FRAMEWORK_CACHE.clear()
+    _FRAMEWORK_CACHE[("enterprise", "a", "n", True)] = object()
+    _FRAMEWORK_CACHE[("ics", "b", "n", True)] = object()
+    _FRAMEWORK_CACHE[("mobile", "c", True)] = object()
+    attck.update(nist=True)
+    assert not any(key[0] in ("enterprise", "ics") for key in _FRAMEWORK_CACHE)
+    assert ("mobile", "c", True) in _FRAMEWORK_CACHE
+    _FRAMEWORK_CACHE.clear()
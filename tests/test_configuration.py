@@ -73,6 +73,34 @@ def test_default_configuration_settings_jsons(attck_configuration, target_attrib
     assert getattr(attck.config.config, target_attribute) == default_config_data[target_attribute]
 
 
+def test_read_from_disk_parses_json_file():
+    import json
+
+    from pyattck.configuration import Options
+
+    data = {"objects": [{"type": "x-mitre-tactic", "name": "test"}]}
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        json.dump(data, f)
+    try:
+        assert Options()._read_from_disk(f.name) == data
+    finally:
+        os.unlink(f.name)
+
+
+def test_get_data_does_not_cache_failed_downloads(monkeypatch):
+    from pyattck.configuration import _JSON_CACHE, Options
+
+    url = "https://swimlane-pyattck.s3.us-west-2.amazonaws.com/merged_enterprise_attck_v1.json"
+    results = iter([{}, {"objects": []}])
+    monkeypatch.setattr(Options, "_load_data", lambda self, value: next(results))
+    _JSON_CACHE.pop(url, None)
+    opt = Options()
+    assert opt.get_data("enterprise_attck_json") == {}
+    assert url not in _JSON_CACHE
+    assert opt.get_data("enterprise_attck_json") == {"objects": []}
+    _JSON_CACHE.pop(url, None)
+
+
 def test_configuration_data_can_be_file_path_location():
     from pyattck import Configuration, Options
 